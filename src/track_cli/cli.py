@@ -1,19 +1,19 @@
 from __future__ import annotations
 
+import functools
 import os
 import re
+from collections import defaultdict
 from datetime import datetime, timedelta, date
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt
-import questionary
-from rich.panel import Panel
-from rich import box
+
+# rich's widgets and questionary (prompt_toolkit) are imported inside the
+# commands that use them to keep CLI start-up fast
 
 app = typer.Typer(
     add_completion=False,
@@ -30,6 +30,17 @@ console = Console()
 LOG_ENV_VAR = "TRACK_LOG_PATH"
 CONFIG_FILE = Path.home() / ".track_config"
 FILENAME_PATTERN = re.compile(r"^(\d{8})-(\d+)---(.+?)---(open|closed)\.log$")
+_MATCH_FILENAME = FILENAME_PATTERN.match
+# Log files are passed around either as Paths or as entries from a directory scan
+LogPath = Union[Path, os.DirEntry]
+# Minimum number of log files before reads are spread over a thread pool
+PARALLEL_READ_MIN_FILES = 8
+# "Key: value" log lines. Lines break wherever str.splitlines() breaks them;
+# the match is anchored to a line start so each line is scanned only once.
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_KV_PATTERN = re.compile(
+    f"(?<![^{_LINE_BREAKS}])([^:{_LINE_BREAKS}]*):([^{_LINE_BREAKS}]*)"
+)
 
 # Period options used in interactive selection and validation
 PERIOD_OPTIONS = [
@@ -99,6 +110,9 @@ def _is_interactive() -> bool:
 
 
 def _prompt_for_log_dir() -> Path:
+    import questionary
+    from rich.panel import Panel
+
     console.print(
         Panel.fit(
             "[bold yellow]Log path not configured.[/bold yellow]\n"
@@ -125,7 +139,9 @@ def _prompt_for_log_dir() -> Path:
         console.print("[red]That path is not writable or invalid. Try again.[/red]")
 
 
+@functools.lru_cache(maxsize=1)
 def get_log_dir() -> Path:
+    # Resolved once per process; env and config do not change mid-command
     # 1) Environment variable overrides everything
     env = os.getenv(LOG_ENV_VAR)
     if env:
@@ -151,170 +167,229 @@ def get_log_dir() -> Path:
 
 
 def now_local_iso() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
 
 
 def today_yyyymmdd() -> str:
     return datetime.now().strftime("%Y%m%d")
 
 
+def _iter_log_entries(log_dir: Path) -> Iterator[os.DirEntry]:
+    # Scan with os.scandir so filename checks work on plain strings and a
+    # Path is only built for entries we actually keep.
+    with os.scandir(log_dir) as it:
+        yield from it
+
+
+def _quick_reject(name: str) -> bool:
+    # Cheap shape check for "YYYYMMDD-..." log names before running the regex
+    return not (
+        name.endswith(".log")
+        and len(name) > 20
+        and name[8] == "-"
+        and name[:8].isdigit()
+    )
+
+
 def next_sequence_for_today(log_dir: Path, yyyymmdd: str) -> int:
+    prefix = f"{yyyymmdd}-"
+    start = len(prefix)
     max_seq = 0
-    for f in log_dir.glob(f"{yyyymmdd}-*---*---*.log"):
-        m = FILENAME_PATTERN.match(f.name)
-        if not m:
+    for entry in _iter_log_entries(log_dir):
+        name = entry.name
+        if not (
+            name.startswith(prefix) and name.endswith(("---open.log", "---closed.log"))
+        ):
             continue
-        if m.group(1) == yyyymmdd:
-            try:
-                seq = int(m.group(2))
-                if seq > max_seq:
-                    max_seq = seq
-            except ValueError:
-                continue
+        # "YYYYMMDD-<seq>---<client>---<status>.log"; the date is already fixed
+        # by the prefix, the sequence must be plain digits and the client non-empty
+        end = name.find("---", start)
+        digits = name[start:end]
+        if end < 0 or not digits.isdecimal() or name.rindex("---") <= end + 3:
+            continue
+        seq = int(digits)
+        if seq > max_seq:
+            max_seq = seq
     return max_seq + 1
 
 
+# Characters that are unsafe in filenames, mapped to readable replacements
+_CLIENT_SANITIZE = str.maketrans(
+    {
+        "/": "-",
+        "\\": "-",
+        "*": "-",
+        "?": "-",
+        "[": "(",
+        "]": ")",
+        ":": "-",
+        "<": "(",
+        ">": ")",
+        "|": "-",
+        '"': "'",
+    }
+)
+
+
 def build_filename(yyyymmdd: str, seq: int, client: str, status: str) -> str:
-    # Sanitize client for safe filename usage; keep it readable
-    safe_client = (
-        client.replace("/", "-")
-        .replace("\\", "-")
-        .replace("*", "-")
-        .replace("?", "-")
-        .replace("[", "(")
-        .replace("]", ")")
-        .replace(":", "-")
-        .replace("<", "(")
-        .replace(">", ")")
-        .replace("|", "-")
-        .replace('"', "'")
-    )
+    # Sanitize client for safe filename usage; keep it readable.
     # Avoid trailing spaces or dots which are problematic on Windows
-    safe_client = safe_client.rstrip(" .")
+    safe_client = client.translate(_CLIENT_SANITIZE).rstrip(" .")
     return f"{yyyymmdd}-{seq}---{safe_client}---{status}.log"
 
 
-def parse_log_file(path: Path) -> Dict[str, str]:
-    data: Dict[str, str] = {}
+def parse_log_file(path: LogPath) -> Dict[str, str]:
+    # Read with raw os.read calls instead of building a buffered text wrapper
+    # (and its extra syscalls) per file
     try:
-        text = path.read_text(encoding="utf-8")
+        fd = os.open(path, os.O_RDONLY)
     except FileNotFoundError:
-        return data
-    for line in text.splitlines():
-        if ":" in line:
-            key, value = line.split(":", 1)
-            data[key.strip()] = value.strip()
-    return data
+        return {}
+    try:
+        # Reads may come back short (network mounts, signals), so keep going
+        # until EOF
+        chunks = []
+        while chunk := os.read(fd, 4096):
+            chunks.append(chunk)
+        raw = b"".join(chunks)
+    finally:
+        os.close(fd)
+    text = raw.decode("utf-8")
+    return {k.strip(): v.strip() for k, v in _KV_PATTERN.findall(text)}
+
+
+def parse_log_files(paths: List[LogPath]) -> List[Dict[str, str]]:
+    # File reads release the GIL, so many small logs are read on a thread
+    # pool; for a handful of files the pool setup would cost more than it saves
+    if len(paths) < PARALLEL_READ_MIN_FILES:
+        return [parse_log_file(p) for p in paths]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as ex:
+        return list(ex.map(parse_log_file, paths))
 
 
 def find_open_logs(log_dir: Path) -> List[Path]:
     return sorted(
-        [p for p in log_dir.glob("*---open.log") if FILENAME_PATTERN.match(p.name)]
+        Path(e.path)
+        for e in _iter_log_entries(log_dir)
+        if e.name.endswith("---open.log")
+        and not _quick_reject(e.name)
+        and _MATCH_FILENAME(e.name)
     )
 
 
-def duration_hours(start: str, end: str) -> float:
-    fmt = "%Y-%m-%d %H:%M:%S"
+@functools.lru_cache(maxsize=4096)
+def _parse_ts(s: str) -> datetime:
+    # Log timestamps are "%Y-%m-%d %H:%M:%S", which fromisoformat parses in C.
+    # Newer fromisoformat also takes dates and UTC offsets, so check the
+    # shape first and keep every result naive, as strptime did.
+    if len(s) != 19 or s[10] != " ":
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    return datetime.fromisoformat(s)
+
+
+def _parse_file_date(yyyymmdd: str) -> datetime:
+    return datetime(int(yyyymmdd[:4]), int(yyyymmdd[4:6]), int(yyyymmdd[6:8]))
+
+
+def duration_hours(start: Union[str, datetime], end: Union[str, datetime]) -> float:
+    # Timestamps may be given as datetimes or as log-file strings
     try:
-        start_dt = datetime.strptime(start, fmt)
-        end_dt = datetime.strptime(end, fmt)
+        start_dt = start if isinstance(start, datetime) else _parse_ts(start)
+        end_dt = end if isinstance(end, datetime) else _parse_ts(end)
+        hours = (end_dt - start_dt).total_seconds() / 3600.0
     except Exception:
         return 0.0
-    hours = (end_dt - start_dt).total_seconds() / 3600.0
     return max(0.0, hours)
 
 
-def list_tasks_for_client(log_dir: Path, client: str) -> List[str]:
-    tasks = set()
-    for path in log_dir.glob("*.log"):
-        m = FILENAME_PATTERN.match(path.name)
-        if not m:
+def build_client_index(log_dir: Path) -> Dict[str, List[os.DirEntry]]:
+    # Map each client to its log files in a single directory scan. Task
+    # names are read from the files only when a client's tasks are needed.
+    index: Dict[str, List[os.DirEntry]] = {}
+    for entry in _iter_log_entries(log_dir):
+        if _quick_reject(entry.name):
             continue
-        if m.group(3) != client:
-            continue
-        meta = parse_log_file(path)
+        m = _MATCH_FILENAME(entry.name)
+        if m:
+            index.setdefault(m.group(3), []).append(entry)
+    return index
+
+
+def tasks_in_logs(paths: List[LogPath]) -> List[str]:
+    tasks = set()
+    for meta in parse_log_files(paths):
         t = meta.get("Task")
         if t:
             tasks.add(t)
-    return sorted(tasks, key=lambda s: s.lower())
+    return sorted(tasks, key=str.lower)
+
+
+def list_tasks_for_client(log_dir: Path, client: str) -> List[str]:
+    return tasks_in_logs(build_client_index(log_dir).get(client, []))
 
 
 def list_clients(log_dir: Path) -> List[str]:
-    clients = set()
-    for path in log_dir.glob("*.log"):
-        m = FILENAME_PATTERN.match(path.name)
-        if m:
-            clients.add(m.group(3))
-    return sorted(clients, key=lambda s: s.lower())
+    return sorted(build_client_index(log_dir), key=str.lower)
 
 
-def parse_period(period_description: str) -> Tuple[datetime, datetime]:
-    pd = period_description.strip().lower()
-    today = date.today()
+def _week_range(d: date) -> Tuple[date, date]:
+    start = d - timedelta(days=d.weekday())
+    end = start + timedelta(days=6)
+    return start, end
 
-    def week_range(d: date) -> Tuple[date, date]:
-        start = d - timedelta(days=d.weekday())
-        end = start + timedelta(days=6)
-        return start, end
 
-    def month_range(d: date) -> Tuple[date, date]:
-        start = d.replace(day=1)
-        if start.month == 12:
-            next_month = start.replace(year=start.year + 1, month=1, day=1)
-        else:
-            next_month = start.replace(month=start.month + 1, day=1)
-        end = next_month - timedelta(days=1)
-        return start, end
-
-    def quarter_range(d: date) -> Tuple[date, date]:
-        q = (d.month - 1) // 3
-        start_month = q * 3 + 1
-        start = date(d.year, start_month, 1)
-        if start_month + 3 > 12:
-            next_q = date(d.year + 1, 1, 1)
-        else:
-            next_q = date(d.year, start_month + 3, 1)
-        end = next_q - timedelta(days=1)
-        return start, end
-
-    def year_range(d: date) -> Tuple[date, date]:
-        start = date(d.year, 1, 1)
-        end = date(d.year, 12, 31)
-        return start, end
-
-    if pd == "today":
-        s = e = today
-    elif pd.startswith("this "):
-        unit = pd.split(" ", 1)[1]
-        if unit == "week":
-            s, e = week_range(today)
-        elif unit == "month":
-            s, e = month_range(today)
-        elif unit == "quarter":
-            s, e = quarter_range(today)
-        elif unit == "year":
-            s, e = year_range(today)
-        else:
-            raise ValueError("Unknown period. Use: week, month, quarter, year")
-    elif pd.startswith("last "):
-        unit = pd.split(" ", 1)[1]
-        if unit == "week":
-            s, e = week_range(today - timedelta(weeks=1))
-        elif unit == "month":
-            d = today.replace(day=1) - timedelta(days=1)
-            s, e = month_range(d)
-        elif unit == "quarter":
-            month = ((today.month - 1) // 3) * 3 + 1
-            this_q_start = date(today.year, month, 1)
-            d = this_q_start - timedelta(days=1)
-            s, e = quarter_range(d)
-        elif unit == "year":
-            s = date(today.year - 1, 1, 1)
-            e = date(today.year - 1, 12, 31)
-        else:
-            raise ValueError("Unknown period. Use: week, month, quarter, year")
+def _month_range(d: date) -> Tuple[date, date]:
+    start = d.replace(day=1)
+    if start.month == 12:
+        next_month = start.replace(year=start.year + 1, month=1, day=1)
+    else:
+        next_month = start.replace(month=start.month + 1, day=1)
+    end = next_month - timedelta(days=1)
+    return start, end
+
+
+def _quarter_range(d: date) -> Tuple[date, date]:
+    q = (d.month - 1) // 3
+    start_month = q * 3 + 1
+    start = date(d.year, start_month, 1)
+    if start_month + 3 > 12:
+        next_q = date(d.year + 1, 1, 1)
     else:
+        next_q = date(d.year, start_month + 3, 1)
+    end = next_q - timedelta(days=1)
+    return start, end
+
+
+def _year_range(d: date) -> Tuple[date, date]:
+    start = date(d.year, 1, 1)
+    end = date(d.year, 12, 31)
+    return start, end
+
+
+# Period phrase -> function mapping today's date to the (first, last) day
+_PERIOD_HANDLERS: Dict[str, Callable[[date], Tuple[date, date]]] = {
+    "today": lambda d: (d, d),
+    "this week": _week_range,
+    "last week": lambda d: _week_range(d - timedelta(weeks=1)),
+    "this month": _month_range,
+    "last month": lambda d: _month_range(d.replace(day=1) - timedelta(days=1)),
+    "this quarter": _quarter_range,
+    "last quarter": lambda d: _quarter_range(_quarter_range(d)[0] - timedelta(days=1)),
+    "this year": _year_range,
+    "last year": lambda d: _year_range(date(d.year - 1, 1, 1)),
+}
+
+
+def parse_period(period_description: str) -> Tuple[datetime, datetime]:
+    pd = period_description.strip().lower()
+    handler = _PERIOD_HANDLERS.get(pd)
+    if handler is None:
+        if pd.startswith(("this ", "last ")):
+            raise ValueError("Unknown period. Use: week, month, quarter, year")
         raise ValueError("Use 'this <period>' or 'last <period>'")
+    s, e = handler(date.today())
 
     start_dt = datetime.combine(s, datetime.min.time())
     end_dt = datetime.combine(e, datetime.max.time())
@@ -323,7 +398,7 @@ def parse_period(period_description: str) -> Tuple[datetime, datetime]:
 
 def within_period(file_date: str, start: datetime, end: datetime) -> bool:
     try:
-        d = datetime.strptime(file_date, "%Y%m%d")
+        d = _parse_file_date(file_date)
     except Exception:
         return False
     return start <= d <= end
@@ -343,10 +418,17 @@ def start(
     ),
 ):
     """Start a tracking log."""
+    from rich.panel import Panel
+
     log_dir = get_log_dir()
+    if not c or not t or not d:
+        import questionary
+    if not c or not t:
+        # One scan serves both the client and the task pickers
+        index = build_client_index(log_dir)
 
     if not c:
-        existing_clients = list_clients(log_dir)
+        existing_clients = sorted(index, key=str.lower)
         if existing_clients:
             choices = existing_clients + ["[Create new client]"]
             selected = questionary.select(
@@ -370,7 +452,7 @@ def start(
                 raise typer.Exit(1)
     if not t:
         # Offer selection from previous tasks or allow typing a new one
-        existing_tasks = list_tasks_for_client(log_dir, c)
+        existing_tasks = tasks_in_logs(index.get(c, []))
         if existing_tasks:
             choices = existing_tasks + ["[Create new task]"]
             selected = questionary.select(
@@ -395,17 +477,24 @@ def start(
         # Description is optional; allow empty input
         d = questionary.text("Description").ask() or ""
 
+    started = now_local_iso()
+    payload = f"Task: {t}\nDescription: {d}\nStart time: {started}\n".encode("utf-8")
     yyyymmdd = today_yyyymmdd()
     seq = next_sequence_for_today(log_dir, yyyymmdd)
-    filename = build_filename(yyyymmdd, seq, c, "open")
-    path = log_dir / filename
-
-    lines = [
-        f"Task: {t}",
-        f"Description: {d}",
-        f"Start time: {now_local_iso()}",
-    ]
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    while True:
+        path = log_dir / build_filename(yyyymmdd, seq, c, "open")
+        # O_EXCL never overwrites an existing log; if a concurrent start took
+        # this sequence number, move on to the next one
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            seq += 1
+            continue
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        break
 
     console.print(
         Panel.fit(
@@ -419,6 +508,8 @@ def start(
 @app.command()
 def end():
     """End an open tracking log."""
+    from rich.panel import Panel
+
     log_dir = get_log_dir()
     open_logs = find_open_logs(log_dir)
     if not open_logs:
@@ -429,6 +520,8 @@ def end():
     if len(open_logs) == 1:
         chosen = open_logs[0]
     else:
+        import questionary
+
         file_choices = [p.name for p in open_logs]
         selected = questionary.select(
             "Select log to close",
@@ -440,17 +533,23 @@ def end():
             raise typer.Exit(1)
         chosen = next(p for p in open_logs if p.name == selected)
 
-    # Append end time and rename to closed
-    with chosen.open("a", encoding="utf-8") as f:
-        f.write(f"End time: {now_local_iso()}\n")
-
-    m = FILENAME_PATTERN.match(chosen.name)
+    m = _MATCH_FILENAME(chosen.name)
     if not m:
         console.print(f"[bold red]Unexpected filename format:[/bold red] {chosen.name}")
         raise typer.Exit(1)
     yyyymmdd, seq, client = m.group(1), m.group(2), m.group(3)
     new_name = build_filename(yyyymmdd, int(seq), client, "closed")
     new_path = chosen.with_name(new_name)
+    if new_path.exists():
+        # rename() would silently replace the earlier closed log
+        console.print(
+            f"[bold red]Closed log already exists:[/bold red] {new_path.name}"
+        )
+        raise typer.Exit(1)
+
+    # Append end time and rename to closed
+    with chosen.open("a", encoding="utf-8") as f:
+        f.write(f"End time: {now_local_iso()}\n")
     chosen.rename(new_path)
 
     console.print(
@@ -470,17 +569,24 @@ def report(
     ),
 ):
     """Show aggregated time for a client and period, broken down by task."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     log_dir = get_log_dir()
+    if not c or not p:
+        import questionary
+
+    # Scan and match filenames once; reused for client choice and aggregation
+    entries = [
+        (m, e)
+        for e in _iter_log_entries(log_dir)
+        if not _quick_reject(e.name) and (m := _MATCH_FILENAME(e.name))
+    ]
 
     # Interactive choices if needed
     if not c:
-        clients = sorted(
-            {
-                FILENAME_PATTERN.match(p.name).group(3)
-                for p in log_dir.glob("*.log")
-                if FILENAME_PATTERN.match(p.name)
-            }
-        )
+        clients = sorted({m.group(3) for m, _ in entries}, key=str.lower)
         if not clients:
             console.print("[bold yellow]No logs found.[/bold yellow]")
             raise typer.Exit()
@@ -513,35 +619,32 @@ def report(
         raise typer.Exit(code=1)
 
     # Aggregate
-    task_to_hours: Dict[str, float] = {}
+    task_to_hours: Dict[str, float] = defaultdict(float)
     total_hours = 0.0
-    for path in log_dir.glob("*.log"):
-        m = FILENAME_PATTERN.match(path.name)
-        if not m:
-            continue
-        file_client = m.group(3)
-        status = m.group(4)
-        if file_client != c or status != "closed":
-            continue
-        meta = parse_log_file(path)
+    # Periods are whole days and a log is named after the day it started, so
+    # the YYYYMMDD filename date can be compared as a string
+    s_key = start_dt.strftime("%Y%m%d")
+    e_key = end_dt.strftime("%Y%m%d")
+    closed = [
+        entry
+        for m, entry in entries
+        if m.group(3) == c and m.group(4) == "closed" and s_key <= m.group(1) <= e_key
+    ]
+    # Bind the per-file timestamp parser to a local for the loop below
+    parse_ts = _parse_ts
+    for meta in parse_log_files(closed):
         start = meta.get("Start time")
         end = meta.get("End time")
         task = meta.get("Task", "Unknown")
         if not start or not end:
             continue
         try:
-            start_ts = datetime.strptime(start, "%Y-%m-%d %H:%M:%S")
-        except Exception:
-            # Fallback to filename date if parsing fails
-            file_date = m.group(1)
-            try:
-                start_ts = datetime.strptime(file_date, "%Y%m%d")
-            except Exception:
-                continue
-        if not (start_dt <= start_ts <= end_dt):
-            continue
-        hours = duration_hours(start, end)
-        task_to_hours[task] = task_to_hours.get(task, 0.0) + hours
+            seconds = (parse_ts(end) - parse_ts(start)).total_seconds()
+        except (ValueError, TypeError):
+            # Unparsable, or mixing naive and offset-aware timestamps
+            seconds = 0.0
+        hours = max(0.0, seconds / 3600.0)
+        task_to_hours[task] += hours
         total_hours += hours
 
     # Render report
@@ -568,6 +671,10 @@ def report(
 @app.command()
 def status():
     """List currently open logs and their running durations."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     log_dir = get_log_dir()
     open_logs = find_open_logs(log_dir)
     if not open_logs:
@@ -589,7 +696,7 @@ def status():
 
     total_running_hours = 0.0
     for p in open_logs:
-        m = FILENAME_PATTERN.match(p.name)
+        m = _MATCH_FILENAME(p.name)
         client = m.group(3) if m else "?"
         meta = parse_log_file(p)
         task = meta.get("Task", "?")
@@ -598,8 +705,7 @@ def status():
         hours = 0.0
         if start:
             try:
-                now_str = now_local_iso()
-                hours = duration_hours(start, now_str)
+                hours = duration_hours(start, datetime.now())
                 elapsed_str = humanize_hours(hours)
                 total_running_hours += hours
             except Exception:
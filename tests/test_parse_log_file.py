@@ -0,0 +1,42 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from track_cli import cli
+
+EXPECTED = {"Task": "x", "Description": "a: b", "Start time": "2026-10-15 09:00:00"}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"Task: x\nDescription: a: b\nStart time: 2026-10-15 09:00:00\n",
+        b"Task: x\r\nDescription: a: b\r\nStart time: 2026-10-15 09:00:00\r\n",
+        b"Task: x\rDescription: a: b\rStart time: 2026-10-15 09:00:00\r",
+        b"  Task :  x \n\n   \n\t\nDescription:a: b\nStart time: 2026-10-15 09:00:00",
+        "Task: x\u2028Description: a: b\x85Start time: 2026-10-15 09:00:00".encode(),
+    ],
+)
+def test_line_endings_and_blank_lines(tmp_path: Path, raw: bytes) -> None:
+    path = tmp_path / "20261015-1---A---closed.log"
+    path.write_bytes(raw)
+    assert cli.parse_log_file(path) == EXPECTED
+
+
+def test_long_lines_without_colon_parse_quickly(tmp_path: Path) -> None:
+    path = tmp_path / "20261015-1---A---closed.log"
+    path.write_text("Task: x\n" + " " * 20000 + "\n" + "y" * 20000 + "\n")
+    t0 = time.perf_counter()
+    assert cli.parse_log_file(path) == {"Task": "x"}
+    assert time.perf_counter() - t0 < 0.5
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2026-10-15", "2026-10-15 09:00:00+02:00", "2026-10-15T09:00:00", "x" * 19],
+)
+def test_timestamps_other_than_naive_seconds_are_rejected(value: str) -> None:
+    with pytest.raises(ValueError):
+        cli._parse_ts(value)
+    assert cli._parse_ts("2026-10-15 09:00:00").tzinfo is None
@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from typer.testing import CliRunner
+
+from track_cli import cli
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def log_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setenv(cli.LOG_ENV_VAR, str(tmp_path))
+    cli.get_log_dir.cache_clear()
+    yield tmp_path
+    cli.get_log_dir.cache_clear()
+
+
+def _start(client: str) -> None:
+    result = runner.invoke(cli.app, ["start", "-c", client, "-t", "task", "-d", "x"])
+    assert result.exit_code == 0, result.output
+
+
+def _end() -> None:
+    result = runner.invoke(cli.app, ["end"])
+    assert result.exit_code == 0, result.output
+
+
+def _names(log_dir: Path) -> list:
+    return sorted(p.name for p in log_dir.iterdir())
+
+
+def test_sequence_follows_highest_number_on_disk(log_dir: Path) -> None:
+    day = cli.today_yyyymmdd()
+    (log_dir / f"{day}-7---other---closed.log").write_text("Task: t\n")
+    (log_dir / f"{day}-x---bad---closed.log").write_text("Task: t\n")
+    (log_dir / "19990101-99---old---closed.log").write_text("Task: t\n")
+    assert cli.next_sequence_for_today(log_dir, day) == 8
+
+
+def test_stale_counter_file_does_not_reuse_sequence(log_dir: Path) -> None:
+    day = cli.today_yyyymmdd()
+    _start("A")
+    _end()
+    (log_dir / f".seq-{day}").write_text("0")
+    _start("A")
+    _end()
+    assert _names(log_dir) == [
+        f".seq-{day}",
+        f"{day}-1---A---closed.log",
+        f"{day}-2---A---closed.log",
+    ]
+
+
+def test_start_steps_past_taken_sequence(
+    log_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    day = cli.today_yyyymmdd()
+    taken = log_dir / f"{day}-1---A---open.log"
+    taken.write_text("Task: earlier\n")
+    # Simulate a concurrent start that claimed the number after our scan
+    monkeypatch.setattr(cli, "next_sequence_for_today", lambda *_: 1)
+    _start("A")
+    assert taken.read_text() == "Task: earlier\n"
+    assert (log_dir / f"{day}-2---A---open.log").exists()
+
+
+def test_end_refuses_to_overwrite_closed_log(log_dir: Path) -> None:
+    day = cli.today_yyyymmdd()
+    closed = log_dir / f"{day}-1---A---closed.log"
+    closed.write_text("Task: first\n")
+    opened = log_dir / f"{day}-1---A---open.log"
+    opened.write_text("Task: second\n")
+    result = runner.invoke(cli.app, ["end"])
+    assert result.exit_code == 1
+    assert closed.read_text() == "Task: first\n"
+    assert opened.read_text() == "Task: second\n"
+
+
+def test_unrelated_files_are_left_alone(log_dir: Path) -> None:
+    day = cli.today_yyyymmdd()
+    (log_dir / ".seq-notes").write_text("keep")
+    (log_dir / f"{day}-x---open.log").write_text("keep")
+    _start("A")
+    _end()
+    assert (log_dir / ".seq-notes").read_text() == "keep"
+    assert (log_dir / f"{day}-x---open.log").read_text() == "keep"
+
+
+def test_only_well_formed_names_count_towards_sequence(log_dir: Path) -> None:
+    day = cli.today_yyyymmdd()
+    (log_dir / f"{day}-2---A---closed.log").write_text("Task: t\n")
+    for seq in (" 7", "+7", "1_0", "-3", "²"):
+        (log_dir / f"{day}-{seq}---A---open.log").write_text("Task: t\n")
+    (log_dir / f"{day}-5.log").write_text("Task: t\n")
+    (log_dir / f"{day}-6---open.log").write_text("Task: t\n")
+    (log_dir / f"{day}-4---A---done.log").write_text("Task: t\n")
+    assert cli.next_sequence_for_today(log_dir, day) == 3